@@ -76,6 +76,37 @@ it's written in **Python**.
 		91
 		>>> connection.close()
 
+	| Scripts sent repeatedly can be uploaded once into the :class:`ScriptStore` class content addressed store:
+
+		- A connection starting with "Store | Language | Code" is read until its writing side is closed and the code,
+		following the separator single space, is stored unmodified under its **SHA-1** hexadecimal digest.
+
+		- A string with the following formatting: "Run | Hash | Procedure | Argument | Argument ...", procedure and
+		arguments being optional, executes the stored script, calling given procedure with given string arguments.
+
+	| Those requests are answered with a newline terminated line: "OK Hash" when the request is accepted,
+	"MISS Hash" when the script is not in the store and has to be uploaded again, "ERROR Message" otherwise.
+
+	Example client code:
+
+		>>> import hashlib
+		>>> import socket
+		>>> code = "def main(message):\n\tApplication.LogMessage(message)\n"
+		>>> connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		>>> connection.connect(("127.0.0.1", 12288))
+		>>> connection.sendall("Store | Python | %s" % code)
+		>>> connection.shutdown(socket.SHUT_WR)
+		>>> connection.recv(1024)
+		'OK b584b9c671a8be41571969cf025af6e902d2feb2\n'
+		>>> connection.close()
+		>>> connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		>>> connection.connect(("127.0.0.1", 12288))
+		>>> connection.send("Run | %s | main | Pouet!" % hashlib.sha1(code).hexdigest())
+		62
+		>>> connection.recv(1024)
+		'OK b584b9c671a8be41571969cf025af6e902d2feb2\n'
+		>>> connection.close()
+
 	The :class:`LoggingStackDataRequestsHandler` class that verbose what the client send:
 
 	Example client code:
@@ -99,6 +130,70 @@ it's written in **Python**.
 		33
 		>>> connection.close()
 
+	The :class:`StreamingPythonStackDataRequestsHandler` class that behaves like the
+	:class:`PythonStackDataRequestsHandler` class but keeps the connection opened while the code is executed and streams
+	back the log messages and standard output produced by the request as incremental frames.
+	| Each frame is formatted as "Type Length:Payload" with the following types:
+
+		- **S**: The request execution started.
+		- **L**: A message logged with *Application.LogMessage*.
+		- **O**: Data written to standard output or standard error.
+		- **D**: The amount of bytes dropped because the client was not reading fast enough.
+		- **R**: The request execution ended successfully.
+		- **E**: The request execution failed, the payload is the exception traceback.
+
+	Example client code:
+
+		>>> import socket
+		>>> connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		>>> connection.connect(("127.0.0.1", 12288))
+		>>> connection.send("Application.LogMessage(\"Pouet!\")\nprint \"Done!\"<!RE>")
+		53
+		>>> connection.recv(1024)
+		'S0:L6:Pouet!O5:Done!O1:\nR0:'
+		>>> connection.close()
+
+	| A **T** frame is sent before closing the connection when the request is refused by the admission control.
+
+**Compression:**
+	| Clients of the :class:`PythonStackDataRequestsHandler` and :class:`StreamingPythonStackDataRequestsHandler`
+	classes can negotiate **zlib** compression by starting the connection with the
+	:attr:`PythonStackDataRequestsHandler.compressionRequest` attribute. The server acknowledges it by sending back the
+	:attr:`PythonStackDataRequestsHandler.compressionResponse` attribute, an empty **Z** frame, before anything else,
+	the client then sending a single **zlib** stream containing the request and its end marker.
+	| Clients should wait for the acknowledgement before sending compressed data: older servers and the other handlers
+	don't answer, in which case the client should reconnect and send its request uncompressed.
+	| Decompressed requests larger than :attr:`Constants.compressionMaxRequestSize` bytes are discarded.
+	| Once negotiated, the streaming handler compresses the frames batches larger than
+	:attr:`Constants.compressionThreshold` bytes with a per connection **zlib** stream, each sync flushed batch being sent
+	as a **Z** frame whose decompressed payload contains regular frames. Smaller batches are sent uncompressed.
+	| The *utilities/benchmarkCompression.py* script reports when compression pays off for a given link bandwidth.
+
+	Example client code:
+
+		>>> import socket
+		>>> import zlib
+		>>> connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		>>> connection.connect(("127.0.0.1", 12288))
+		>>> connection.settimeout(1)
+		>>> connection.sendall("<!Z>")
+		>>> connection.recv(3)
+		'Z0:'
+		>>> compressor = zlib.compressobj()
+		>>> connection.sendall(compressor.compress("print \"Pouet!\"<!RE>") + compressor.flush())
+		>>> connection.recv(1024)
+		'S0:O6:Pouet!O1:\nR0:'
+		>>> connection.close()
+
+**Admission Control:**
+	| To protect the application interactivity, requests are admitted per client address using a token bucket
+	refilled at **Requests Rate** requests per second up to **Requests Burst** requests, and refused when the client
+	already has **Max In Flight** requests waiting in the requests stack. A zero value disables the related limit.
+	| Connections of clients over limit are closed as soon as accepted, and a refused request closes its connection.
+	| Limits are set in the **TCPServer_property** and stored in the preferences. Admitted, throttled and rejected
+	requests counters are reported in the server status file, written when the server starts or stops and when
+	requests have been refused.
+
 **Others:**
 
 """
@@ -108,12 +203,16 @@ it's written in **Python**.
 #**********************************************************************************************************************
 import SocketServer
 import collections
+import hashlib
 import inspect
 import os
 import re
 import socket
+import sys
 import threading
 import time
+import traceback
+import zlib
 import ConfigParser
 from win32com.client import constants as siConstants
 
@@ -135,7 +234,15 @@ __all__ = ["ProgrammingError",
 			"EchoRequestsHandler",
 			"LoggingStackDataRequestsHandler",
 			"DefaultStackDataRequestsHandler",
+			"ScriptStore",
 			"PythonStackDataRequestsHandler",
+			"StreamingPythonStackDataRequestsHandler",
+			"StreamingRequest",
+			"StreamingRequestWriter",
+			"StreamingRequestApplication",
+			"AdmissionController",
+			"AdmissionTCPServer",
+			"ThreadingAdmissionTCPServer",
 			"Constants",
 			"Runtime",
 			"TCPServer",
@@ -177,31 +284,114 @@ class LoggingStackDataRequestsHandler(SocketServer.BaseRequestHandler):
 			if not data:
 				break
 
-			Runtime.requestsStack.append(data)
+			if not _pushRequest(self.client_address, data):
+				break
 		return True
 
 	@staticmethod
 	def processData():
 		while Runtime.requestsStack:
-			Application.LogMessage(Runtime.requestsStack.popleft())
+			Application.LogMessage(_popRequest())
 		return True
 
 class DefaultStackDataRequestsHandler(SocketServer.BaseRequestHandler):
 
+	storeRequest = r"\s*Store\s*\|\s*(?P<language>%s)\s*\| ?(?P<code>.*)"
+	runRequest = r"\s*Run\s*\|\s*(?P<hash>[0-9a-fA-F]{40})\s*(\|\s*(?P<procedure>[^|]*?)\s*(\|(?P<arguments>.*))?)?$"
+
 	def handle(self):
+		allData = []
+		size = 0
 		while True:
 			data = self.request.recv(1024)
 			if not data:
 				break
 
-			Runtime.requestsStack.append(data)
+			# Uploads are aggregated until the client closes the connection writing side.
+			if allData or re.match(r"\s*Store\s*\|", data):
+				size += len(data)
+				if size <= Constants.scriptStoreMaxSize + 1024:
+					allData.append(data)
+				elif allData[-1] is not None:
+					# Oversized uploads are discarded until the client stops sending.
+					self.reply("ERROR Script exceeds '%s' bytes store size!" % Constants.scriptStoreMaxSize)
+					allData.append(None)
+				continue
+
+			runMatch = re.match(self.runRequest, data.strip(), re.S)
+			if runMatch and not Runtime.scriptStore:
+				self.reply("ERROR Script store is unavailable!")
+				continue
+
+			if runMatch and not Runtime.scriptStore.contains(runMatch.group("hash")):
+				self.reply("MISS %s" % runMatch.group("hash").lower())
+				continue
+
+			if not _pushRequest(self.client_address, data):
+				runMatch and self.reply("ERROR Request throttled!")
+				break
+
+			runMatch and self.reply("OK %s" % runMatch.group("hash").lower())
+
+		if allData and allData[-1] is not None:
+			self.storeScript("".join(allData))
+		return True
+
+	def reply(self, message):
+		try:
+			self.request.sendall("%s\n" % message)
+		except socket.error:
+			pass
 		return True
 
+	def storeScript(self, data):
+		match = re.match(self.storeRequest % "|".join(Constants.languages), data, re.S)
+		if not match:
+			return self.reply("ERROR Invalid store request!")
+
+		if not Runtime.scriptStore:
+			return self.reply("ERROR Script store is unavailable!")
+
+		if len(match.group("code")) > Constants.scriptStoreMaxSize:
+			return self.reply("ERROR Script exceeds '%s' bytes store size!" % Constants.scriptStoreMaxSize)
+
+		if not Runtime.admission.admit(self.client_address[0],
+										Runtime.requestsRate,
+										Runtime.requestsBurst,
+										Runtime.maxInFlight):
+			return self.reply("ERROR Request throttled!")
+
+		# The script is stored before replying so that it can be run as soon as the client gets the answer.
+		try:
+			hash = Runtime.scriptStore.store(match.group("language"), match.group("code"))
+		finally:
+			Runtime.admission.release(self.client_address[0])
+
+		if not hash:
+			return self.reply("ERROR Script could not be stored!")
+		return self.reply("OK %s" % hash)
+
 	@staticmethod
 	def processData():
 		while Runtime.requestsStack:
-			data = Runtime.requestsStack.popleft().strip()
-			if os.path.exists(data):
+			data = _popRequest().strip()
+			runMatch = re.match(DefaultStackDataRequestsHandler.runRequest, data, re.S)
+			if runMatch:
+				script = Runtime.scriptStore and Runtime.scriptStore.get(runMatch.group("hash"))
+				if not script:
+					Application.LogMessage("%s | '%s' script is not in the store!" % (Constants.name, runMatch.group("hash")),
+											siConstants.siWarning)
+					continue
+
+				language, code = script
+				if runMatch.group("procedure"):
+					arguments = runMatch.group("arguments")
+					arguments = arguments is not None and [argument.strip() for argument in arguments.split("|")] or []
+					value = Application.ExecuteScriptCode(code, language, runMatch.group("procedure"), arguments)
+				else:
+					value = Application.ExecuteScriptCode(code, language)
+				Application.LogMessage("%s | Request return value: '%s'." % (Constants.name, value), siConstants.siVerbose)
+			elif os.path.exists(data):
 				value = Application.ExecuteScript(data)
 				# Application.LogMessage("%s | Request return value: '%s'." % (Constants.name, value), siConstants.siVerbose)
 			else:
@@ -213,14 +403,205 @@ class DefaultStackDataRequestsHandler(SocketServer.BaseRequestHandler):
 						break
 		return True
 
+class ScriptStore(object):
+
+	def __init__(self, directory, maxSize, maxCacheSize):
+		self.directory = directory
+		self.maxSize = maxSize
+		self.maxCacheSize = maxCacheSize
+
+		self.__entries = {}
+		self.__cache = {}
+		self.__cacheSize = 0
+		# Scripts are stored from the requests handlers threads and run from the main thread.
+		self.__lock = threading.RLock()
+
+		if not os.path.exists(self.directory):
+			os.makedirs(self.directory)
+
+		# Stored scripts are named "Hash.Language", their modification time being the last access time.
+		for fileName in os.listdir(self.directory):
+			if not re.match(r"^[0-9a-f]{40}\.(%s)$" % "|".join(Constants.languages), fileName):
+				continue
+
+			hash, language = os.path.splitext(fileName)
+			path = os.path.join(self.directory, fileName)
+			self.__entries[hash] = {"language" : language[1:],
+									"size" : os.path.getsize(path),
+									"time" : os.path.getmtime(path)}
+
+	def __getPath(self, hash):
+		return os.path.join(self.directory, "%s.%s" % (hash, self.__entries[hash]["language"]))
+
+	def __forget(self, hash):
+		if hash in self.__cache:
+			self.__cacheSize -= len(self.__cache.pop(hash))
+		self.__entries.pop(hash, None)
+		return True
+
+	def __touch(self, hash):
+		self.__entries[hash]["time"] = time.time()
+		try:
+			os.utime(self.__getPath(hash), None)
+		except OSError:
+			# The file has been deleted outside the store, e.g. by a temporary files cleaner.
+			self.__forget(hash)
+			return False
+		return True
+
+	def __cacheCode(self, hash, code):
+		if len(code) > self.maxCacheSize:
+			return False
+
+		self.__cache[hash] = code
+		self.__cacheSize += len(code)
+		while self.__cacheSize > self.maxCacheSize:
+			leastRecent = min(self.__cache, key=lambda x: self.__entries[x]["time"])
+			self.__cacheSize -= len(self.__cache.pop(leastRecent))
+		return True
+
+	def __evict(self):
+		size = sum([entry["size"] for entry in self.__entries.values()])
+		while size > self.maxSize:
+			leastRecent = min(self.__entries, key=lambda x: self.__entries[x]["time"])
+			try:
+				os.remove(self.__getPath(leastRecent))
+			except OSError:
+				pass
+			size -= self.__entries[leastRecent]["size"]
+			self.__forget(leastRecent)
+		return True
+
+	def store(self, language, code):
+		self.__lock.acquire()
+		try:
+			return self.__store(language, code)
+		finally:
+			self.__lock.release()
+
+	def __store(self, language, code):
+		if len(code) > self.maxSize:
+			return
+
+		hash = hashlib.sha1(code).hexdigest()
+		if hash in self.__entries and self.__touch(hash):
+			return hash
+
+		# The whole store directory may have been deleted outside the store, e.g. by a temporary files cleaner.
+		self.__forget(hash)
+		try:
+			if not os.path.exists(self.directory):
+				os.makedirs(self.directory)
+
+			file = open(os.path.join(self.directory, "%s.%s" % (hash, language)), "wb")
+			try:
+				file.write(code)
+			finally:
+				file.close()
+		except (IOError, OSError):
+			return
+
+		self.__entries[hash] = {"language" : language, "size" : len(code), "time" : time.time()}
+		self.__cacheCode(hash, code)
+		self.__evict()
+		return hash
+
+	def contains(self, hash):
+		self.__lock.acquire()
+		try:
+			hash = hash.lower()
+			return hash in self.__entries and os.path.exists(self.__getPath(hash))
+		finally:
+			self.__lock.release()
+
+	def get(self, hash):
+		self.__lock.acquire()
+		try:
+			return self.__get(hash.lower())
+		finally:
+			self.__lock.release()
+
+	def __get(self, hash):
+		if hash not in self.__entries:
+			return
+
+		code = self.__cache.get(hash)
+		if code is None:
+			try:
+				file = open(self.__getPath(hash), "rb")
+				code = file.read()
+				file.close()
+			except IOError:
+				self.__forget(hash)
+				return
+
+			if not self.__touch(hash):
+				return
+			self.__cacheCode(hash, code)
+		elif not self.__touch(hash):
+			return
+		return self.__entries[hash]["language"], code
+
 class PythonStackDataRequestsHandler(SocketServer.BaseRequestHandler):
 
 	requestEnd = "<!RE>"
+	compressionRequest = "<!Z>"
+	compressionResponse = "Z0:"
+
+	def setup(self):
+		self.negotiated = False
+		self.compressor = None
+		self.decompressor = None
+		self.decompressedSize = 0
+		self.oversized = False
 
 	def handle(self):
+		data = self.readRequest()
+		if not self.oversized:
+			_pushRequest(self.client_address, data)
+		return True
+
+	def negotiateCompression(self, data):
+		while data and len(data) < len(self.compressionRequest) and self.compressionRequest.startswith(data):
+			chunk = self.request.recv(1024)
+			if not chunk:
+				break
+			data += chunk
+
+		if not data.startswith(self.compressionRequest):
+			return data
+
+		self.compressor = zlib.compressobj(Constants.compressionLevel)
+		self.decompressor = zlib.decompressobj()
+		self.request.sendall(self.compressionResponse)
+		return data[len(self.compressionRequest):] or self.request.recv(1024)
+
+	def recv(self):
+		data = self.request.recv(1024)
+		if not self.negotiated:
+			self.negotiated = True
+			data = self.negotiateCompression(data)
+
+		if not self.decompressor:
+			return data
+
+		# Compressed chunks may not yield any data until enough input has been received.
+		while data:
+			data = self.decompressor.decompress(data, Constants.compressionMaxRequestSize - self.decompressedSize + 1)
+			self.decompressedSize += len(data)
+			if self.decompressedSize > Constants.compressionMaxRequestSize:
+				self.oversized = True
+				return ""
+
+			if data:
+				return data
+			data = self.request.recv(1024)
+		return self.decompressor.flush()
+
+	def readRequest(self):
 		allData = []
 		while True:
-			data = self.request.recv(1024)
+			data = self.recv()
 			if not data:
 				break
 
@@ -229,23 +610,305 @@ class PythonStackDataRequestsHandler(SocketServer.BaseRequestHandler):
 				break
 
 			allData.append(data)
-			if len(allData) >=1:
+			if len(allData) >= 2:
 				tail = allData[-2] + allData[-1]
 				if self.requestEnd in tail:
 					allData[-2] = tail[:tail.find(self.requestEnd)]
 					allData.pop()
 					break
 
-		Runtime.requestsStack.append("".join(allData))
-		return True
+		return "".join(allData)
 
 	@staticmethod
 	def processData():
 		while Runtime.requestsStack:
-			value = Application.ExecuteScriptCode(Runtime.requestsStack.popleft(), "Python")
+			value = Application.ExecuteScriptCode(_popRequest(), "Python")
 			Application.LogMessage("%s | Request return value: '%s'." % (Constants.name, value), siConstants.siVerbose)
 		return True
 
+class StreamingRequest(object):
+
+	def __init__(self, code, bufferSize):
+		self.code = code
+		self.bufferSize = bufferSize
+
+		self.__frames = collections.deque()
+		self.__size = 0
+		self.__dropped = 0
+		self.__started = False
+		self.__startSent = False
+		self.__done = False
+		self.__abandoned = False
+		self.__condition = threading.Condition()
+
+	def start(self):
+		self.__condition.acquire()
+		try:
+			self.__started = True
+			self.__condition.notify()
+		finally:
+			self.__condition.release()
+		return True
+
+	def push(self, type, payload=""):
+		if isinstance(payload, unicode):
+			payload = payload.encode("utf-8")
+
+		self.__condition.acquire()
+		try:
+			if self.__abandoned:
+				return False
+
+			if len(payload) > self.bufferSize:
+				self.__dropped += len(payload) - self.bufferSize
+				payload = payload[:self.bufferSize]
+
+			self.__frames.append((type, payload))
+			self.__size += len(payload)
+			# Oldest frames are dropped once the buffer is full, the last one is always kept.
+			while self.__size > self.bufferSize and len(self.__frames) > 1:
+				type, payload = self.__frames.popleft()
+				self.__size -= len(payload)
+				self.__dropped += len(payload)
+			self.__condition.notify()
+		finally:
+			self.__condition.release()
+		return True
+
+	def finish(self, type, payload=""):
+		self.__condition.acquire()
+		try:
+			self.push(type, payload)
+			self.__done = True
+			self.__condition.notify()
+		finally:
+			self.__condition.release()
+		return True
+
+	def abandon(self):
+		self.__condition.acquire()
+		try:
+			self.__abandoned = True
+			self.__frames.clear()
+			self.__size = 0
+		finally:
+			self.__condition.release()
+		return True
+
+	def pull(self, timeout):
+		self.__condition.acquire()
+		try:
+			if not self.__frames and not self.__done and self.__started == self.__startSent:
+				self.__condition.wait(timeout)
+
+			frames = []
+			if self.__started and not self.__startSent:
+				frames.append(("S", ""))
+				self.__startSent = True
+			if self.__dropped:
+				frames.append(("D", str(self.__dropped)))
+			frames.extend(self.__frames)
+			self.__frames.clear()
+			self.__size = 0
+			self.__dropped = 0
+			return frames, self.__done
+		finally:
+			self.__condition.release()
+
+class StreamingRequestWriter(object):
+
+	def __init__(self, request):
+		self.request = request
+
+	def write(self, data):
+		self.request.push("O", data)
+
+	def flush(self):
+		pass
+
+class StreamingRequestApplication(object):
+
+	def __init__(self, application, request):
+		self.__dict__["_StreamingRequestApplication__application"] = application
+		self.__dict__["_StreamingRequestApplication__request"] = request
+
+	def __getattr__(self, attribute):
+		return getattr(self.__application, attribute)
+
+	def __setattr__(self, attribute, value):
+		setattr(self.__application, attribute, value)
+
+	def LogMessage(self, message, severity=siConstants.siInfo):
+		# Streaming the message must never break the script where the application would log it.
+		try:
+			self.__request.push("L", isinstance(message, basestring) and message or str(message))
+		except Exception:
+			pass
+		return self.__application.LogMessage(message, severity)
+
+class StreamingPythonStackDataRequestsHandler(PythonStackDataRequestsHandler):
+
+	# Connections are kept opened until the request is executed, they need to be served from their own threads.
+	threaded = True
+	throttledResponse = "T9:Throttled"
+
+	def handle(self):
+		request = StreamingRequest(self.readRequest(), Constants.streamBufferSize)
+		if self.oversized:
+			try:
+				self.send(self.encodeFrame("E", "Request exceeds '%s' bytes!" % Constants.compressionMaxRequestSize))
+			except socket.error:
+				pass
+			return True
+
+		if not _pushRequest(self.client_address, request):
+			try:
+				self.request.sendall(self.throttledResponse)
+			except socket.error:
+				pass
+			return True
+
+		while True:
+			frames, done = request.pull(Constants.streamPollInterval)
+			if frames:
+				try:
+					self.send("".join([self.encodeFrame(type, payload) for type, payload in frames]))
+				except socket.error:
+					# The client went away, the request keeps executing but its output is discarded.
+					request.abandon()
+					break
+
+			if done:
+				break
+		return True
+
+	def send(self, data):
+		if self.compressor and len(data) >= Constants.compressionThreshold:
+			data = self.encodeFrame("Z", self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH))
+		self.request.sendall(data)
+
+	@staticmethod
+	def encodeFrame(type, payload):
+		return "%s%d:%s" % (type, len(payload), payload)
+
+	@staticmethod
+	def processData():
+		while Runtime.requestsStack:
+			request = _popRequest()
+			request.start()
+			stdout, stderr = sys.stdout, sys.stderr
+			sys.stdout = sys.stderr = StreamingRequestWriter(request)
+			try:
+				try:
+					exec request.code in _getScriptNamespace(StreamingRequestApplication(Application, request))
+					request.finish("R")
+				except BaseException:
+					request.finish("E", traceback.format_exc())
+					Application.LogMessage("%s | Request raised an exception!" % Constants.name, siConstants.siWarning)
+			finally:
+				sys.stdout, sys.stderr = stdout, stderr
+		return True
+
+class AdmissionController(object):
+
+	def __init__(self):
+		self.admitted = 0
+		self.throttled = 0
+		self.rejected = 0
+
+		self.__clients = {}
+		self.__lock = threading.Lock()
+
+	def __getClient(self, address, burst):
+		client = self.__clients.get(address)
+		if client is None:
+			client = self.__clients[address] = {"tokens" : float(max(burst, 1)), "time" : time.time(), "inFlight" : 0}
+		return client
+
+	def __refill(self, client, rate, burst):
+		now = time.time()
+		client["tokens"] = min(float(max(burst, 1)), client["tokens"] + (now - client["time"]) * rate)
+		client["time"] = now
+		return client["tokens"]
+
+	def __verify(self, client, rate, burst, maxInFlight):
+		if maxInFlight and client["inFlight"] >= maxInFlight:
+			self.rejected += 1
+			return False
+
+		if rate and self.__refill(client, rate, burst) < 1:
+			self.throttled += 1
+			return False
+		return True
+
+	def check(self, address, rate, burst, maxInFlight):
+		self.__lock.acquire()
+		try:
+			return self.__verify(self.__getClient(address, burst), rate, burst, maxInFlight)
+		finally:
+			self.__lock.release()
+
+	def admit(self, address, rate, burst, maxInFlight):
+		self.__lock.acquire()
+		try:
+			client = self.__getClient(address, burst)
+			if not self.__verify(client, rate, burst, maxInFlight):
+				return False
+
+			if rate:
+				client["tokens"] -= 1
+			client["inFlight"] += 1
+			self.admitted += 1
+			return True
+		finally:
+			self.__lock.release()
+
+	def release(self, address):
+		self.__lock.acquire()
+		try:
+			client = self.__clients.get(address)
+			if client and client["inFlight"]:
+				client["inFlight"] -= 1
+		finally:
+			self.__lock.release()
+		return True
+
+	def prune(self, rate, burst):
+		# Idle clients with a full bucket are indistinguishable from new ones.
+		self.__lock.acquire()
+		try:
+			for address, client in self.__clients.items():
+				if client["inFlight"]:
+					continue
+
+				if not rate or self.__refill(client, rate, burst) >= max(burst, 1):
+					del self.__clients[address]
+		finally:
+			self.__lock.release()
+		return True
+
+	def getCounters(self):
+		return {"admitted" : self.admitted, "throttled" : self.throttled, "rejected" : self.rejected}
+
+class AdmissionTCPServer(SocketServer.TCPServer):
+
+	def verify_request(self, request, client_address):
+		# Connections are refused early when their client is already over limit, each request being admitted when pushed.
+		if Runtime.admission.check(client_address[0], Runtime.requestsRate, Runtime.requestsBurst, Runtime.maxInFlight):
+			return True
+
+		response = getattr(self.RequestHandlerClass, "throttledResponse", None)
+		if response:
+			try:
+				request.sendall(response)
+			except socket.error:
+				pass
+		return False
+
+class ThreadingAdmissionTCPServer(SocketServer.ThreadingMixIn, AdmissionTCPServer):
+
+	daemon_threads = True
+
 class Constants(object):
 
 	name = "TCPServer"
@@ -261,6 +924,18 @@ class Constants(object):
 	defaultPort = 12288
 	defaultRequestsHandler = DefaultStackDataRequestsHandler
 	languages = ("VBScript", "JScript", "Python", "PythonScript", "PerlScript")
+	streamBufferSize = 65536
+	streamPollInterval = 0.1
+	defaultRequestsRate = 0.0
+	defaultRequestsBurst = 16
+	defaultMaxInFlight = 0
+	statusUpdateInterval = 1.0
+	compressionLevel = 6
+	compressionThreshold = 1024
+	compressionMaxRequestSize = 67108864
+	scriptStoreDirectory = "tcpserver_scripts"
+	scriptStoreMaxSize = 67108864
+	scriptStoreCacheSize = 16777216
 
 class Runtime(object):
 
@@ -269,6 +944,13 @@ class Runtime(object):
 	port = Constants.defaultPort
 	requestsHandler = Constants.defaultRequestsHandler
 	requestsStack = collections.deque()
+	requestsRate = Constants.defaultRequestsRate
+	requestsBurst = Constants.defaultRequestsBurst
+	maxInFlight = Constants.defaultMaxInFlight
+	scriptStore = None
+	admission = AdmissionController()
+	admissionCounters = admission.getCounters()
+	statusUpdateTime = 0
 
 class TCPServer(object):
 
@@ -347,7 +1029,8 @@ class TCPServer(object):
 			raise ServerOperationError("%s | '%s' server is already online!" % (self.__class__.__name__, self))
 
 		try:
-			self.__server = SocketServer.TCPServer((self.__address, self.__port), self.__handler)
+			server = getattr(self.__handler, "threaded", False) and ThreadingAdmissionTCPServer or AdmissionTCPServer
+			self.__server = server((self.__address, self.__port), self.__handler)
 			self.__worker = threading.Thread(target=self.__server.serve_forever)
 			self.__worker.setDaemon(True)
 			self.__worker.start()
@@ -368,6 +1051,8 @@ class TCPServer(object):
 		if not self.__online:
 			raise ServerOperationError("%s | '%s' server is not online!" % (self.__class__.__name__, self))
 
+		# Pending requests are discarded so that no handler keeps waiting for them.
+		_clearRequests()
 		self.__server.shutdown()
 		self.__server = None
 		self.__worker = None
@@ -376,6 +1061,44 @@ class TCPServer(object):
 		return True
 
 
+def _pushRequest(clientAddress, data):
+	if not Runtime.admission.admit(clientAddress[0], Runtime.requestsRate, Runtime.requestsBurst, Runtime.maxInFlight):
+		return False
+
+	Runtime.requestsStack.append((clientAddress[0], data))
+	return True
+
+def _popRequest():
+	address, data = Runtime.requestsStack.popleft()
+	Runtime.admission.release(address)
+	return data
+
+def _clearRequests():
+	while Runtime.requestsStack:
+		data = _popRequest()
+		if isinstance(data, StreamingRequest):
+			data.finish("E", "Server stopped!")
+	return True
+
+def _getScriptNamespace(application):
+	# Mimics the globals the application exposes to scripts executed with "Application.ExecuteScriptCode".
+	namespace = {"__name__" : "__main__", "Application" : application}
+	for name in ("XSIUtils", "XSIFactory", "XSIMath", "XSIUIToolkit"):
+		if name in globals():
+			namespace[name] = globals()[name]
+	return namespace
+
+def _getScriptStore():
+	if not Runtime.scriptStore:
+		try:
+			Runtime.scriptStore = ScriptStore(XSIUtils.BuildPath(XSIUtils.Environment('TEMP'), Constants.scriptStoreDirectory),
+											Constants.scriptStoreMaxSize,
+											Constants.scriptStoreCacheSize)
+		except OSError:
+			Application.LogMessage("%s | Cannot create the script store, 'Store' and 'Run' requests are disabled!" % \
+			Constants.name, siConstants.siWarning)
+	return Runtime.scriptStore
+
 def _getServerStatusFilePath():
 	"""
 	Returns the expected path to tcpserver.ini
@@ -394,6 +1117,9 @@ def _setServerStatusFile(**kwargs):
 		touched=<time>
 		xsibooted=<time>
 		started=<time>
+		admitted=<count>
+		throttled=<count>
+		rejected=<count>
 
 	"""
 	config = ConfigParser.ConfigParser()
@@ -402,6 +1128,7 @@ def _setServerStatusFile(**kwargs):
 
 	kwargs['active'] = kwargs.setdefault('active', 0)
 	kwargs['touched'] = int(time.time())
+	kwargs.update(Runtime.admission.getCounters())
 	# kwargs['port'] = kwargs.setdefault('port', Constants.defaultPort)
 	# kwargs['address'] = kwargs.setdefault('address', Constants.defaultAddress)
 	# kwargs['handler'] = kwargs.setdefault('handler', Constants.defaultRequestsHandler)
@@ -429,6 +1156,27 @@ def _getServerStatusFileData():
 
 	return data
 
+def _updateServerStatusFile():
+	"""
+	Refreshes the admission control counters in the server status .ini file when requests have been refused.
+	"""
+	if not Runtime.requestsRate and not Runtime.maxInFlight:
+		return False
+
+	counters = Runtime.admission.getCounters()
+	if (counters["throttled"], counters["rejected"]) == \
+	(Runtime.admissionCounters["throttled"], Runtime.admissionCounters["rejected"]) or \
+	time.time() - Runtime.statusUpdateTime < Constants.statusUpdateInterval:
+		return False
+
+	Application.LogMessage("%s | Admission control refused requests: '%s' throttled, '%s' rejected!" % (
+	Constants.name, counters["throttled"], counters["rejected"]), siConstants.siWarning)
+
+	Runtime.admissionCounters = counters
+	Runtime.statusUpdateTime = time.time()
+	_setServerStatusFile(**(_getServerStatusFileData() or {}))
+	return True
+
 
 def XSILoadPlugin(pluginRegistrar):
 	pluginRegistrar.Author = Constants.author
@@ -483,6 +1231,8 @@ def TCPServer_stop_Execute():
 def TCPServer_timerEvent_OnEvent(context):
 	# Application.LogMessage("%s | 'TCPServer_timerEvent' called!" % Constants.name, siConstants.siVerbose)
 	Runtime.requestsHandler.processData()
+	Runtime.admission.prune(Runtime.requestsRate, Runtime.requestsBurst)
+	_updateServerStatusFile()
 	return False
 
 def TCPServer_Init(context):
@@ -503,6 +1253,9 @@ def TCPServer_property_Define(context):
 	property.AddParameter2("RequestsHandlers_siInt",
 							siConstants.siInt4,
 							_getRequestsHandlers().index(Runtime.requestsHandler))
+	property.AddParameter2("RequestsRate_siDouble", siConstants.siDouble, Runtime.requestsRate, 0, 1000, 0, 100)
+	property.AddParameter2("RequestsBurst_siInt", siConstants.siInt4, Runtime.requestsBurst, 0, 1000, 0, 100)
+	property.AddParameter2("MaxInFlight_siInt", siConstants.siInt4, Runtime.maxInFlight, 0, 1000, 0, 100)
 	return True
 
 def TCPServer_property_DefineLayout(context):
@@ -522,6 +1275,12 @@ def TCPServer_property_DefineLayout(context):
 						"Requests Handlers", siConstants.siControlCombo)
 	layout.EndGroup()
 
+	layout.AddGroup("Admission Control", True, 0)
+	layout.AddItem("RequestsRate_siDouble", "Requests Rate")
+	layout.AddItem("RequestsBurst_siInt", "Requests Burst")
+	layout.AddItem("MaxInFlight_siInt", "Max In Flight")
+	layout.EndGroup()
+
 	layout.AddGroup()
 	layout.AddRow()
 	layout.AddButton("Start_Server_button", "Start TCPServer")
@@ -563,6 +1322,33 @@ def TCPServer_property_RequestsHandlers_siInt_OnChanged():
 	module._restartServer()
 	return True
 
+def TCPServer_property_RequestsRate_siDouble_OnChanged():
+	module = _getModule()
+	if not module:
+		return
+
+	module.Runtime.requestsRate = PPG.RequestsRate_siDouble.Value
+	module._storeSettings()
+	return True
+
+def TCPServer_property_RequestsBurst_siInt_OnChanged():
+	module = _getModule()
+	if not module:
+		return
+
+	module.Runtime.requestsBurst = PPG.RequestsBurst_siInt.Value
+	module._storeSettings()
+	return True
+
+def TCPServer_property_MaxInFlight_siInt_OnChanged():
+	module = _getModule()
+	if not module:
+		return
+
+	module.Runtime.maxInFlight = PPG.MaxInFlight_siInt.Value
+	module._storeSettings()
+	return True
+
 def TCPServer_property_Start_Server_button_OnClicked():
 	module = _getModule()
 	if not module:
@@ -579,6 +1365,16 @@ def TCPServer_property_Stop_Server_button_OnClicked():
 	module._stopServer()
 	return True
 
+def _addAdmissionSettingsParameters(property):
+	# Settings installed by previous versions don't have the admission control parameters.
+	if not property.Parameters("RequestsRate_siDouble"):
+		property.AddParameter2("RequestsRate_siDouble", siConstants.siDouble, Constants.defaultRequestsRate, 0, 1000, 0, 100)
+	if not property.Parameters("RequestsBurst_siInt"):
+		property.AddParameter2("RequestsBurst_siInt", siConstants.siInt4, Constants.defaultRequestsBurst, 0, 1000, 0, 100)
+	if not property.Parameters("MaxInFlight_siInt"):
+		property.AddParameter2("MaxInFlight_siInt", siConstants.siInt4, Constants.defaultMaxInFlight, 0, 1000, 0, 100)
+	return True
+
 def _registerSettingsProperty():
 	if not Application.Preferences.Categories(Constants.settings):
 		property = Application.ActiveSceneRoot.AddCustomProperty(Constants.settings);
@@ -587,7 +1383,10 @@ def _registerSettingsProperty():
 		property.AddParameter2("RequestsHandler_siInt",
 								siConstants.siInt4,
 								_getRequestsHandlers().index(Constants.defaultRequestsHandler))
+		_addAdmissionSettingsParameters(property)
 		Application.InstallCustomPreferences("TCPServer_settings_property", "TCPServer_settings_property")
+	else:
+		_addAdmissionSettingsParameters(Application.Preferences.Categories(Constants.settings))
 	return True
 
 def _storeSettings():
@@ -595,6 +1394,9 @@ def _storeSettings():
 		Application.preferences.SetPreferenceValue("%s.Address_siString" % Constants.settings, Runtime.address)
 		Application.preferences.SetPreferenceValue("%s.Port_siInt" % Constants.settings, Runtime.port)
 		Application.preferences.SetPreferenceValue("%s.RequestsHandler_siInt" % Constants.settings, _getRequestsHandlers().index(Runtime.requestsHandler))
+		Application.preferences.SetPreferenceValue("%s.RequestsRate_siDouble" % Constants.settings, Runtime.requestsRate)
+		Application.preferences.SetPreferenceValue("%s.RequestsBurst_siInt" % Constants.settings, Runtime.requestsBurst)
+		Application.preferences.SetPreferenceValue("%s.MaxInFlight_siInt" % Constants.settings, Runtime.maxInFlight)
 	return True
 
 def _restoreSettings():
@@ -602,6 +1404,9 @@ def _restoreSettings():
 		Runtime.address = str(Application.preferences.GetPreferenceValue("%s.Address_siString" % Constants.settings))
 		Runtime.port = int(Application.preferences.GetPreferenceValue("%s.Port_siInt" % Constants.settings))
 		Runtime.requestsHandler = _getRequestsHandlers()[int(Application.preferences.GetPreferenceValue("%s.RequestsHandler_siInt" % Constants.settings))]
+		Runtime.requestsRate = float(Application.preferences.GetPreferenceValue("%s.RequestsRate_siDouble" % Constants.settings))
+		Runtime.requestsBurst = int(Application.preferences.GetPreferenceValue("%s.RequestsBurst_siInt" % Constants.settings))
+		Runtime.maxInFlight = int(Application.preferences.GetPreferenceValue("%s.MaxInFlight_siInt" % Constants.settings))
 	return True
 
 def _getServer(address, port, requestsHandler):
@@ -613,6 +1418,9 @@ def _startServer():
 			Application.LogMessage("%s | The server is already online!" % Constants.name, siConstants.siWarning)
 			return
 
+	# The script store is created from the main thread, requests handlers threads only querying it.
+	if Runtime.requestsHandler is DefaultStackDataRequestsHandler:
+		_getScriptStore()
 	Runtime.server = _getServer(Runtime.address, Runtime.port, Runtime.requestsHandler)
 	Runtime.server.start()
 	_setServerStatusFile(active=1, address=Runtime.address, port=Runtime.port, handler=Runtime.requestsHandler)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmarkCompression.py
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the **zlib** frames compression used by the TCPServer streaming handler and reports for each payload size
+	and link bandwidth whether compressing the payload pays off compared to sending it uncompressed.
+
+**Others:**
+
+"""
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import random
+import sys
+import time
+import zlib
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2013 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COMPRESSION_LEVEL",
+		"SIZES",
+		"BANDWIDTHS",
+		"ITERATIONS",
+		"getScriptPayload",
+		"getScenePayload",
+		"benchmarkPayload",
+		"benchmarkCompression"]
+
+COMPRESSION_LEVEL = 6
+SIZES = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+# Link bandwidths in bytes per second: 10 Mbit/s, 100 Mbit/s and 1 Gbit/s.
+BANDWIDTHS = (("10Mb", 1250000), ("100Mb", 12500000), ("1Gb", 125000000))
+ITERATIONS = 16
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getScriptPayload(size):
+	"""
+	This definition returns a generated **Python** script payload of given size.
+
+	:param size: Payload size. ( Integer )
+	:return: Payload. ( String )
+	"""
+
+	random.seed(size)
+	lines = []
+	while sum([len(line) for line in lines]) < size:
+		lines.append("Application.SetValue(\"Model_%d.kine.local.pos%s\", %f)\n" % (random.randint(0, 512),
+																					random.choice("xyz"),
+																					random.random() * 100))
+	return "".join(lines)[:size]
+
+def getScenePayload(size):
+	"""
+	This definition returns a generated scene dump payload of given size.
+
+	:param size: Payload size. ( Integer )
+	:return: Payload. ( String )
+	"""
+
+	random.seed(size)
+	lines = []
+	while sum([len(line) for line in lines]) < size:
+		lines.append("%s\n" % " ".join(["%.6f" % random.uniform(-1, 1) for i in range(9)]))
+	return "".join(lines)[:size]
+
+def benchmarkPayload(payload):
+	"""
+	This definition compresses and decompresses given payload the way the streaming handler does.
+
+	:param payload: Payload. ( String )
+	:return: Compressed size, compression and decompression time per iteration. ( Tuple )
+	"""
+
+	start = time.time()
+	for i in range(ITERATIONS):
+		compressor = zlib.compressobj(COMPRESSION_LEVEL)
+		compressed = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+		zlib.decompressobj().decompress(compressed)
+	return len(compressed), (time.time() - start) / ITERATIONS
+
+def benchmarkCompression():
+	"""
+	This definition prints the benchmark results table.
+	"""
+
+	sys.stdout.write("%-8s%10s%12s%10s%12s" % ("Payload", "Size", "Compressed", "Ratio", "Time (ms)"))
+	for name, bandwidth in BANDWIDTHS:
+		sys.stdout.write("%10s" % name)
+	sys.stdout.write("\n")
+
+	for payloadName, getPayload in (("Script", getScriptPayload), ("Scene", getScenePayload)):
+		for size in SIZES:
+			payload = getPayload(size)
+			compressedSize, duration = benchmarkPayload(payload)
+			sys.stdout.write("%-8s%10d%12d%10.2f%12.3f" % (payloadName,
+															size,
+															compressedSize,
+															float(size) / compressedSize,
+															duration * 1000))
+			for name, bandwidth in BANDWIDTHS:
+				# Compression pays off when the transfer time saved is greater than the compression overhead.
+				saving = float(size - compressedSize) / bandwidth - duration
+				sys.stdout.write("%10s" % (saving > 0 and "yes" or "no"))
+			sys.stdout.write("\n")
+
+if __name__ == "__main__":
+	benchmarkCompression()